@@ -1,7 +1,68 @@
+from typing import TYPE_CHECKING
+
 from .api import ScannerIntegrationAPI
-from .const import *
 from .error_codes import error_dict
 
+if TYPE_CHECKING:
+    # Static analysis sees the real enums, at runtime they are loaded by __getattr__
+    from .const import (
+        ScannerModels,
+        SmartSourceModels,
+        EjectControl,
+        ScanOptions,
+        ConfigPaths,
+        ScannerSettings,
+        ScannerModes,
+        ImageSettings,
+        MICRSettings,
+        AuxReaderSettings,
+        SorterSettings,
+        PrinterSettings,
+        ImageFormats,
+        DPISettings,
+        MiscSettings,
+        BooleanValues,
+        SystemConstants,
+    )
+
+# Constants are imported from .const on first access (PEP 562)
+_CONST_NAMES = frozenset(
+    (
+        "ScannerModels",
+        "SmartSourceModels",
+        "EjectControl",
+        "ScanOptions",
+        "ConfigPaths",
+        "ScannerSettings",
+        "ScannerModes",
+        "ImageSettings",
+        "MICRSettings",
+        "AuxReaderSettings",
+        "SorterSettings",
+        "PrinterSettings",
+        "ImageFormats",
+        "DPISettings",
+        "MiscSettings",
+        "BooleanValues",
+        "SystemConstants",
+    )
+)
+
+
+def __getattr__(name):
+    if name in _CONST_NAMES:
+        from . import const
+
+        value = getattr(const, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _CONST_NAMES)
+
+
 __all__ = [
     "ScannerIntegrationAPI",
     "ScannerModels",
@@ -2,7 +2,6 @@ import ctypes
 from .exceptions import BuicapException
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -10,16 +9,25 @@ class DCLibraryInitializer:
     """
     This class is used to load the DLL and set up the function signatures for the Digital Check scanner.
     It uses ctypes to load the DLL and define the argument and return types for each function.
+
+    Every entry point gets an explicit ``argtypes`` (an empty list for the no-argument ones) so
+    ctypes converts arguments through the declared types instead of probing each Python value
+    on every call.
+
+    ``use_last_error`` is passed to ``ctypes.WinDLL`` and defaults to ``False``, the ctypes default.
+    Pass ``use_last_error=True`` when debugging to make ``ctypes.get_last_error()`` report the
+    error set by the last DLL call.
     """
 
-    def __init__(self, dll_path: str):
+    def __init__(self, dll_path: str, use_last_error: bool = False):
         self.dll_path = dll_path
 
         try:
-            self.lib = ctypes.WinDLL(self.dll_path)  # Load library DLL
+            # Load library DLL
+            self.lib = ctypes.WinDLL(self.dll_path, use_last_error=use_last_error)
             self.setup_functions()
         except Exception as e:
-            logger.error(f"Error loading DLL: {e}")
+            logger.error("Error loading DLL: %s", e)
             raise BuicapException(f"Error loading DLL: {e}")
 
     def setup_functions(self):
@@ -28,6 +36,7 @@ class DCLibraryInitializer:
         self.lib.BUICSetParamString.restype = ctypes.c_int
 
         # BUICInit
+        self.lib.BUICInit.argtypes = []
         self.lib.BUICInit.restype = ctypes.c_int
 
         # IsDCCUSBScannerAvailable
@@ -38,9 +47,11 @@ class DCLibraryInitializer:
         self.lib.IsDCCUSBScannerAvailable.restype = ctypes.c_int
 
         # Clean resources
+        self.lib.BUICExit.argtypes = []
         self.lib.BUICExit.restype = ctypes.c_int
 
         # Eject document
+        self.lib.BUICEjectDocument.argtypes = []
         self.lib.BUICEjectDocument.restype = ctypes.c_int
 
         # BUICEjectPocket
@@ -52,6 +63,7 @@ class DCLibraryInitializer:
         self.lib.DCCCleanMode.restype = ctypes.c_int
 
         # Clean Document
+        self.lib.BUICClearDocument.argtypes = []
         self.lib.BUICClearDocument.restype = ctypes.c_int
 
         # DocketPorCalibrate
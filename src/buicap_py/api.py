@@ -1,14 +1,21 @@
-import ctypes
-from ._core import DCLibraryInitializer
 from .exceptions import BuicapException
 from .error_codes import error_dict
 from functools import wraps
+from typing import Optional
 import logging
 import os
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_unknown_error = "Unknown error (code: {})".format
+
+# Valid iMode values for dcc_clean_mode and docket_port_calibrate
+_BINARY_MODES = frozenset((0, 1))
+
+# Values used to reset the DCCScan output buffers before each scan
+_EMPTY_MICR = bytes(80)
+_EMPTY_DOC_STATUS = [0] * 32
+
 
 def check_loaded(func):
     """Decorator to check if the DLL is loaded before executing a function."""
@@ -31,17 +38,109 @@ class ScannerIntegrationAPI:
     All functions are decorated with `@check_loaded` to ensure the DLL is loaded before executing.
 
     Parameters:
-        dll_path (str): Path to the DLL file.
+        dll_path (str or os.PathLike): Path to the DLL file.
+        use_last_error (bool): Debug option, load the DLL with ctypes `use_last_error` enabled so
+            `ctypes.get_last_error()` can be used for diagnostics. Defaults to False, as in ctypes.
     """
 
-    def __init__(self, dll_path: str):
+    __slots__ = (
+        "_dll_loaded",
+        "dll_path",
+        "lib",
+        "_set_param_string",
+        "_init",
+        "_is_usb_scanner_available",
+        "_exit",
+        "_eject_document",
+        "_eject_pocket",
+        "_clean_mode",
+        "_clear_document",
+        "_docket_port_calibrate",
+        "_set_param",
+        "_get_param",
+        "_scan",
+        "_str_param_cache",
+        "_micr_buf",
+        "_final_q",
+        "_final_c",
+        "_doc_status",
+        "_doc_status_ptr",
+        "_scan_out_args",
+        "_vendor_id",
+        "_product_id",
+        "_vendor_ref",
+        "_product_ref",
+        "__weakref__",
+    )
+
+    # Instance attributes holding the DLL entry points, released by close()
+    _DLL_FUNCTION_ATTRS = (
+        "_set_param_string",
+        "_init",
+        "_is_usb_scanner_available",
+        "_exit",
+        "_eject_document",
+        "_eject_pocket",
+        "_clean_mode",
+        "_clear_document",
+        "_docket_port_calibrate",
+        "_set_param",
+        "_get_param",
+        "_scan",
+    )
+
+    def __init__(self, dll_path: str, use_last_error: bool = False):
+        # ctypes and the DLL loader are only imported once a scanner is actually used
+        import ctypes
+        from ._core import DCLibraryInitializer
+
         self._dll_loaded = False
 
-        if not os.path.exists(dll_path):
+        dll_path = os.fspath(dll_path)
+        if not os.path.isfile(dll_path):
             raise FileNotFoundError(f"DLL not found in {dll_path}")
 
         self.dll_path = dll_path
-        self.lib = DCLibraryInitializer(self.dll_path).lib
+        self.lib = DCLibraryInitializer(self.dll_path, use_last_error).lib
+
+        # Bind the DLL entry points once so each call skips the ctypes attribute lookup.
+        self._set_param_string = self.lib.BUICSetParamString
+        self._init = self.lib.BUICInit
+        self._is_usb_scanner_available = self.lib.IsDCCUSBScannerAvailable
+        self._exit = self.lib.BUICExit
+        self._eject_document = self.lib.BUICEjectDocument
+        self._eject_pocket = self.lib.BUICEjectPocket
+        self._clean_mode = self.lib.DCCCleanMode
+        self._clear_document = self.lib.BUICClearDocument
+        self._docket_port_calibrate = self.lib.DocketPortCalibrate
+        self._set_param = self.lib.BUICSetParam
+        self._get_param = self.lib.BUICGetParam
+        self._scan = self.lib.DCCScan
+
+        # Encoded values of the string parameters, keyed by parameter id: {iParameter: (str, bytes)}
+        self._str_param_cache = {}
+
+        # DCCScan output buffers, allocated once and reset before every scan
+        self._micr_buf = ctypes.create_string_buffer(80)  # Buffer de 80 bytes
+        self._final_q = ctypes.c_int()
+        self._final_c = ctypes.c_int()
+        self._doc_status = (ctypes.c_int * 32)()  # Array de 32 enteros
+        self._doc_status_ptr = ctypes.cast(
+            self._doc_status, ctypes.POINTER(ctypes.c_int)
+        )
+        # Trailing DCCScan arguments (pszMICR, piFinalImageQuality, piFinalContrast, piDocStatus)
+        self._scan_out_args = (
+            self._micr_buf,
+            ctypes.byref(self._final_q),
+            ctypes.byref(self._final_c),
+            self._doc_status_ptr,
+        )
+
+        # IsDCCUSBScannerAvailable out-params, reused by every availability check
+        self._vendor_id = ctypes.c_int()
+        self._product_id = ctypes.c_int()
+        self._vendor_ref = ctypes.byref(self._vendor_id)
+        self._product_ref = ctypes.byref(self._product_id)
         self._dll_loaded = True
 
     def _error_message(self, error_code: int) -> str:
@@ -54,7 +153,8 @@ class ScannerIntegrationAPI:
         Returns:
             str: The error message.
         """
-        return error_dict.get(error_code, f"Unknown error (code: {error_code})")
+        # The fallback message is only formatted for codes missing from error_dict
+        return error_dict.get(error_code) or _unknown_error(error_code)
 
     @check_loaded
     def buic_set_param_string(self, iParameter: int, sParamString: str) -> int:
@@ -92,22 +192,31 @@ class ScannerIntegrationAPI:
             BuicapException: If the operation fails, with details in the error code/message.
         """
 
-        sParamString_encode = str(sParamString).encode("utf-8")
-        result = self.lib.BUICSetParamString(iParameter, sParamString_encode)
+        # Compare the str form, values like 200 and 200.0 are equal but encode differently
+        if type(sParamString) is not str:
+            sParamString = str(sParamString)
+        cached = self._str_param_cache.get(iParameter)
+        if cached is not None and cached[0] == sParamString:
+            sParamString_encode = cached[1]
+        else:
+            sParamString_encode = sParamString.encode("utf-8")
+            self._str_param_cache[iParameter] = (sParamString, sParamString_encode)
+
+        result = self._set_param_string(iParameter, sParamString_encode)
         if result != 0:
             error_msg = self._error_message(result)
             raise BuicapException(f"Failed to set parameter {iParameter}: {error_msg}")
 
-        logger.info(f"Parameter {iParameter} set to {sParamString}")
-        return int(result)
+        logger.info("Parameter %s set to %s", iParameter, sParamString)
+        return result
 
     @check_loaded
     def buic_init(self) -> int:
         """initializes the DLL and checks the status of the SCSI/USB connection"""
         try:
-            return int(self.lib.BUICInit())
+            return self._init()
         except Exception as e:
-            logger.error(f"Error initializing DLL: {e}")
+            logger.error("Error initializing DLL: %s", e)
             raise BuicapException(f"Failed to initialize DLL")
 
     @check_loaded
@@ -119,22 +228,22 @@ class ScannerIntegrationAPI:
             dict: A dictionary containing 'vendor_id', 'product_id', and 'result' (detected model or error code).
         """
 
-        VENDOR_ID = ctypes.c_int()
-        PRODUCT_ID = ctypes.c_int()
+        VENDOR_ID = self._vendor_id
+        PRODUCT_ID = self._product_id
+        VENDOR_ID.value = 0
+        PRODUCT_ID.value = 0
 
         # Call the function to check for USB scanner availability
         try:
-            result = self.lib.IsDCCUSBScannerAvailable(
-                ctypes.byref(VENDOR_ID), ctypes.byref(PRODUCT_ID)
-            )
+            result = self._is_usb_scanner_available(self._vendor_ref, self._product_ref)
         except Exception as e:
-            logger.error(f"Error checking USB scanner availability: {e}")
+            logger.error("Error checking USB scanner availability: %s", e)
             raise BuicapException(f"Failed to check USB scanner availability")
 
         return {
             "vendor_id": VENDOR_ID.value,
             "product_id": PRODUCT_ID.value,
-            "result": int(result),
+            "result": result,
         }
 
     @check_loaded
@@ -144,11 +253,14 @@ class ScannerIntegrationAPI:
             return
         self._dll_loaded = False
         try:
-            return int(self.lib.BUICExit())
+            return self._exit()
         except Exception as e:
-            logger.error(f"Error closing DLL: {e}")
+            logger.error("Error closing DLL: %s", e)
             raise BuicapException(f"Failed to close DLL")
         finally:
+            # The cached entry points keep the DLL object alive, release them with lib
+            for attr in self._DLL_FUNCTION_ATTRS:
+                setattr(self, attr, None)
             self.lib = None
             self.dll_path = None
 
@@ -166,11 +278,9 @@ class ScannerIntegrationAPI:
             BuicapException: If the operation fails
         """
         try:
-            return int(
-                self.lib.BUICEjectDocument()
-            )  # Call the function to eject the document
+            return self._eject_document()  # Call the function to eject the document
         except Exception as e:
-            logger.error(f"Error ejecting document: {e}")
+            logger.error("Error ejecting document: %s", e)
             raise BuicapException(f"Failed to eject document")
 
     @check_loaded
@@ -186,13 +296,16 @@ class ScannerIntegrationAPI:
             - EJECT_KIOSK 3
         Returns:
             int: It returns either 0 on success or SCAN_NO_CHEQUES (-212) if a document had not been pre-scanned.
+
+        Raises:
+            BuicapException: If iPocket is not 0 or the operation fails.
         """
         try:
             if iPocket != 0:
                 raise ValueError("iPocket must be 0")
-            return int(self.lib.BUICEjectPocket(iDirection, iPocket))
+            return self._eject_pocket(iDirection, iPocket)
         except Exception as e:
-            logger.error(f"Error ejecting pocket: {e}")
+            logger.error("Error ejecting pocket: %s", e)
             raise BuicapException(f"Failed to eject pocket")
 
     @check_loaded
@@ -200,13 +313,17 @@ class ScannerIntegrationAPI:
         """
         When iMode is 1, the scanner motors will turn slowly so it is easier to clean the wheels and optics
         using a cleaning card. When iMode is 0, the scanner will return to normal scan mode.
+
+        Raises:
+            ValueError: If iMode is not the integer 0 or 1.
+            BuicapException: If the operation fails.
         """
-        if iMode not in (0, 1):
+        if not isinstance(iMode, int) or iMode not in _BINARY_MODES:
             raise ValueError("iMode must be 0 or 1")
         try:
-            return int(self.lib.DCCCleanMode(iMode))
+            return self._clean_mode(iMode)
         except Exception as e:
-            logger.error(f"Error setting clean mode: {e}")
+            logger.error("Error setting clean mode: %s", e)
             raise BuicapException(f"Failed to set clean mode")
 
     @check_loaded
@@ -218,11 +335,14 @@ class ScannerIntegrationAPI:
             int:
             - SCAN_NO_CHEQUES (-212) if a document had not been pre-scanned
             - SCAN_DOUBLE_FEED (-217) if a document had been pre-scanned
+
+        Raises:
+            BuicapException: If the operation fails.
         """
         try:
-            return int(self.lib.BUICCleanDocument())
+            return self._clear_document()
         except Exception as e:
-            logger.error(f"Error cleaning document: {e}")
+            logger.error("Error cleaning document: %s", e)
             raise BuicapException(f"Failed to clean document")
 
     @check_loaded
@@ -235,13 +355,17 @@ class ScannerIntegrationAPI:
 
         Returns:
             int:
+
+        Raises:
+            ValueError: If iMode is not the integer 0 or 1.
+            BuicapException: If the operation fails.
         """
-        if iMode not in (0, 1):
+        if not isinstance(iMode, int) or iMode not in _BINARY_MODES:
             raise ValueError("iMode must be 0 or 1")
         try:
-            return int(self.lib.DocketPortCalibrate(iMode))
+            return self._docket_port_calibrate(iMode)
         except Exception as e:
-            logger.error(f"Error calibrating docket port: {e}")
+            logger.error("Error calibrating docket port: %s", e)
             raise BuicapException(f"Failed to calibrate docket port")
 
     @check_loaded
@@ -259,7 +383,7 @@ class ScannerIntegrationAPI:
         Raises:
             BuicapException: If the operation fails, with details in the error code/message.
         """
-        result = self.lib.BUICSetParam(iParam, iValue)
+        result = self._set_param(iParam, iValue)
         if result < 0:
             error_msg = self._error_message(result)
             raise BuicapException(f"Failed to set parameter {iParam}: {error_msg}")
@@ -278,7 +402,21 @@ class ScannerIntegrationAPI:
         Returns:
             int: Current value of parameter selected in iParam.
         """
-        return int(self.lib.BUICGetParam(iParam))
+        return self._get_param(iParam)
+
+    @check_loaded
+    def buic_get_params(self, iParams) -> dict:
+        """
+        Returns the configuration parameters of the specified values, see `buic_get_param`.
+
+        Parameters:
+            iParams (iterable of int): Parameters to be returned.
+
+        Returns:
+            dict: Current value of each parameter, keyed by parameter.
+        """
+        get_param = self._get_param
+        return {iParam: get_param(iParam) for iParam in iParams}
 
     @check_loaded
     def dcc_scan(
@@ -295,6 +433,10 @@ class ScannerIntegrationAPI:
 
         Returns:
             dict: A dictionary containing MICR, image quality, contrast, document status, and scan result.
+
+        Note:
+            `dcc_scan_jpeg_only(front_jpeg, back_jpeg)` returns the same result as
+            `dcc_scan(front_jpeg=front_jpeg, back_jpeg=back_jpeg)` and skips the TIFF arguments.
         """
 
         front_tiff = front_tiff.encode("ascii") if front_tiff else None
@@ -302,33 +444,87 @@ class ScannerIntegrationAPI:
         front_jpeg = front_jpeg.encode("ascii") if front_jpeg else None
         back_jpeg = back_jpeg.encode("ascii") if back_jpeg else None
 
-        micr_buffer = ctypes.create_string_buffer(80)  # Buffer de 80 bytes
-        final_image_quality = ctypes.c_int()
-        final_contrast = ctypes.c_int()
-        doc_status = (ctypes.c_int * 32)()  # Array de 32 enteros
-
-        result = self.lib.DCCScan(
-            front_tiff,
-            back_tiff,
-            front_jpeg,
-            back_jpeg,
-            micr_buffer,
-            ctypes.byref(final_image_quality),
-            ctypes.byref(final_contrast),
-            ctypes.cast(doc_status, ctypes.POINTER(ctypes.c_int)),
+        return self._scan_core(front_tiff, back_tiff, front_jpeg, back_jpeg)
+
+    @check_loaded
+    def dcc_scan_jpeg_only(
+        self, front_jpeg: Optional[str] = None, back_jpeg: Optional[str] = None
+    ) -> dict:
+        """
+        Scans a check saving only the front and back JPEG images, see `dcc_scan`.
+
+        Args:
+            front_jpeg (str or None): Filename for the front JPEG image.
+            back_jpeg (str or None): Filename for the back JPEG image.
+
+        Returns:
+            dict: A dictionary containing MICR, image quality, contrast, document status, and scan result.
+        """
+        return self._scan_core(
+            None,
+            None,
+            front_jpeg.encode("ascii") if front_jpeg else None,
+            back_jpeg.encode("ascii") if back_jpeg else None,
         )
 
-        micr_text = (
-            micr_buffer.raw.partition(b"\x00")[0]
-            .decode("ascii", errors="ignore")
-            .strip()
+    @check_loaded
+    def dcc_scan_many(self, front_jpegs: list, back_jpegs: list) -> list:
+        """
+        Scans one check per pair of JPEG filenames and returns the result of each scan.
+
+        DCCScan is called through ctypes.WinDLL, which releases the GIL for the duration of the
+        call, so other Python threads keep running while the scanner is busy.
+
+        Args:
+            front_jpegs (list of str or None): Filenames for the front JPEG images, empty names are not saved.
+            back_jpegs (list of str or None): Filenames for the back JPEG images, empty names are not saved.
+
+        Returns:
+            list: One `dcc_scan` result dictionary per scan. Scanning stops after the first
+            scan that returns a negative result, which is included as the last entry.
+
+        Raises:
+            ValueError: If `front_jpegs` and `back_jpegs` have different lengths.
+        """
+        if len(front_jpegs) != len(back_jpegs):
+            raise ValueError("front_jpegs and back_jpegs must have the same length")
+
+        fronts = [name.encode("ascii") if name else None for name in front_jpegs]
+        backs = [name.encode("ascii") if name else None for name in back_jpegs]
+
+        results = []
+        scan_core = self._scan_core
+        for front_jpeg, back_jpeg in zip(fronts, backs):
+            scan = scan_core(None, None, front_jpeg, back_jpeg)
+            results.append(scan)
+            if scan["result"] < 0:
+                break
+        return results
+
+    def _scan_core(self, front_tiff, back_tiff, front_jpeg, back_jpeg) -> dict:
+        """Calls DCCScan with already encoded filenames (or None) and unpacks the output buffers."""
+        micr_buffer = self._micr_buf
+        final_image_quality = self._final_q
+        final_contrast = self._final_c
+        doc_status = self._doc_status
+
+        micr_buffer.raw = _EMPTY_MICR
+        doc_status[:] = _EMPTY_DOC_STATUS
+        final_image_quality.value = 0
+        final_contrast.value = 0
+
+        result = self._scan(
+            front_tiff, back_tiff, front_jpeg, back_jpeg, *self._scan_out_args
         )
 
+        # .value copies only up to the first NUL and never reads past the buffer
+        micr_text = micr_buffer.value.decode("ascii", errors="ignore").strip()
+
         return {
             "micr": micr_text,
             "final_image_quality": final_image_quality.value,
             "final_contrast": final_contrast.value,
-            "doc_status": list(doc_status),
+            "doc_status": doc_status[:],  # slicing builds the list in C
             "result": result,
         }
 
@@ -345,6 +541,8 @@ __all__ = [
     "docket_port_calibrate",
     "buic_set_param",
     "buic_get_param",
-    "buic_get_param",
+    "buic_get_params",
     "dcc_scan",
+    "dcc_scan_jpeg_only",
+    "dcc_scan_many",
 ]
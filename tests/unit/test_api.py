@@ -2,10 +2,11 @@ import buicap_py as dcc
 from unittest.mock import patch
 import pytest
 from pathlib import Path
+import weakref
 
 @pytest.fixture
 def mock_dll():
-    with patch("os.path.exists", return_value=True):
+    with patch("os.path.isfile", return_value=True):
         with patch('ctypes.WinDLL') as mock:
             dll = mock.return_value
             dll.BUICSetParamString.return_value = 0
@@ -73,6 +74,10 @@ def test_api_close(mock_dll):
     api.close()
     mock_dll.BUICExit.assert_called_once()
 
+    # Test that the DLL and its cached entry points are released
+    assert api.lib is None
+    assert api._scan is None and api._exit is None
+
 def test_buic_set_param_error_handling(mock_dll):
     mock_dll.BUICSetParam.return_value = -100 
     api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
@@ -83,4 +88,181 @@ def test_buic_set_param_error_handling(mock_dll):
             iValue=dcc.ScannerModes.CFG_SCAN_MODE_KIOSK
         )
     # Test that the error message is as expected
-    assert f"Failed to set parameter" in str(excinfo.value)
\ No newline at end of file
+    assert f"Failed to set parameter" in str(excinfo.value)
+
+def test_api_call_after_close(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+    api.close()
+
+    # Test that the DLL loaded check is restored after close
+    with pytest.raises(dcc.api.BuicapException) as excinfo:
+        api.buic_get_param(iParam=dcc.ScannerSettings.CFG_MISC_SCAN_MODE)
+    assert "DLL not loaded" in str(excinfo.value)
+    mock_dll.BUICGetParam.assert_not_called()
+
+def test_buic_set_param_string_encoding(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+    ini_path = Path("C:/Path/To/BUICSCAN.INI")
+
+    # Test that Path values are encoded and the encoded value is reused
+    api.buic_set_param_string(iParameter=dcc.ConfigPaths.CFG_INIPATH, sParamString=ini_path)
+    api.buic_set_param_string(iParameter=dcc.ConfigPaths.CFG_INIPATH, sParamString=ini_path)
+    first, second = mock_dll.BUICSetParamString.call_args_list
+    assert first.args == (dcc.ConfigPaths.CFG_INIPATH, str(ini_path).encode("utf-8"))
+    assert second.args[1] is first.args[1]
+
+def test_dcc_scan_many(mock_dll):
+    mock_dll.DCCScan.side_effect = [0, -212, 0]
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that the batch stops after the first failed scan
+    results = api.dcc_scan_many(["f1.jpg", "f2.jpg", "f3.jpg"], ["b1.jpg", "b2.jpg", "b3.jpg"])
+    assert [scan["result"] for scan in results] == [0, -212]
+    assert mock_dll.DCCScan.call_count == 2
+    assert mock_dll.DCCScan.call_args_list[0].args[:4] == (None, None, b"f1.jpg", b"b1.jpg")
+
+def test_buic_get_params(mock_dll):
+    mock_dll.BUICGetParam.side_effect = lambda iParam: iParam * 10
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test single and batched parameter reads
+    assert api.buic_get_param(iParam=3) == 30
+    assert api.buic_get_params([1, 2]) == {1: 10, 2: 20}
+    assert mock_dll.BUICGetParam.call_count == 3
+
+def test_scanner_initialization_dll_path(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path=Path("fake/path/buicap32.dll"))
+
+    # Test that path-like DLL paths are stored as str
+    assert api.dll_path == str(Path("fake/path/buicap32.dll"))
+
+    with patch("os.path.isfile", return_value=False):
+        with pytest.raises(FileNotFoundError):
+            dcc.ScannerIntegrationAPI(dll_path="fake/path")
+
+def test_dcc_scan_jpeg_only(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that only the JPEG filenames are passed to the DLL
+    assert api.dcc_scan_jpeg_only("front.jpg", "back.jpg")["result"] == 0
+    assert mock_dll.DCCScan.call_args.args[:4] == (None, None, b"front.jpg", b"back.jpg")
+
+def test_api_released_without_close(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+    api_ref = weakref.ref(api)
+
+    # Test that the loaded API holds no reference cycle
+    del api
+    assert api_ref() is None
+
+def test_buic_set_param_string_equal_values(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that values comparing equal but converting to different strings are re-encoded
+    for value in (200, 200.0, 1, True):
+        api.buic_set_param_string(iParameter=dcc.ScannerSettings.CFG_SCANNERTYPE, sParamString=value)
+    sent = [call.args[1] for call in mock_dll.BUICSetParamString.call_args_list]
+    assert sent == [b"200", b"200.0", b"1", b"True"]
+
+def test_dcc_scan_resets_output_buffers(mock_dll):
+    def scan(front_tiff, back_tiff, front_jpeg, back_jpeg, micr, quality, contrast, doc_status):
+        # Only the first scan writes the output buffers
+        if mock_dll.DCCScan.call_count == 1:
+            micr.value = b" T123456789T "
+            quality._obj.value = 80
+            contrast._obj.value = 45
+            doc_status[0] = 5
+            return 0
+        return -212
+
+    mock_dll.DCCScan.side_effect = scan
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that the DLL output is unpacked
+    first = api.dcc_scan()
+    assert first == {
+        "micr": "T123456789T",
+        "final_image_quality": 80,
+        "final_contrast": 45,
+        "doc_status": [5] + [0] * 31,
+        "result": 0,
+    }
+
+    # Test that a scan that writes nothing returns reset values and leaves the first result intact
+    second = api.dcc_scan()
+    assert second == {
+        "micr": "",
+        "final_image_quality": 0,
+        "final_contrast": 0,
+        "doc_status": [0] * 32,
+        "result": -212,
+    }
+    assert first["doc_status"] == [5] + [0] * 31
+
+def test_api_argument_errors(mock_dll):
+    dll_error = OSError("exception: access violation")
+    mock_dll.BUICEjectDocument.side_effect = dll_error
+    mock_dll.BUICClearDocument.side_effect = dll_error
+    mock_dll.DCCCleanMode.side_effect = dll_error
+    mock_dll.DocketPortCalibrate.side_effect = dll_error
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that DLL and pocket errors are raised as BuicapException
+    with pytest.raises(dcc.api.BuicapException):
+        api.eject_document()
+    with pytest.raises(dcc.api.BuicapException):
+        api.buic_clean_document()
+    with pytest.raises(dcc.api.BuicapException):
+        api.dcc_clean_mode(1)
+    with pytest.raises(dcc.api.BuicapException):
+        api.docket_port_calibrate(0)
+    with pytest.raises(dcc.api.BuicapException):
+        api.buic_eject_pocket(iDirection=1, iPocket=1)
+    mock_dll.BUICEjectPocket.assert_not_called()
+
+    # Test that non-integer modes are rejected before calling the DLL
+    for iMode in (1.0, "1", 2):
+        with pytest.raises(ValueError):
+            api.dcc_clean_mode(iMode)
+        with pytest.raises(ValueError):
+            api.docket_port_calibrate(iMode)
+    assert mock_dll.DCCCleanMode.call_count == 1
+    assert mock_dll.DocketPortCalibrate.call_count == 1
+
+def test_dcc_scan_empty_jpeg_names(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that empty filenames are passed as None like dcc_scan does
+    api.dcc_scan_jpeg_only("", "back.jpg")
+    api.dcc_scan_many(["front.jpg"], [""])
+    first, second = mock_dll.DCCScan.call_args_list
+    assert first.args[:4] == (None, None, None, b"back.jpg")
+    assert second.args[:4] == (None, None, b"front.jpg", None)
+
+def test_api_attributes_are_fixed(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that attributes outside __slots__ are rejected, before and after close
+    with pytest.raises(AttributeError):
+        api._micr_bufx = None
+    api.close()
+    with pytest.raises(AttributeError):
+        api._micr_bufx = None
+
+def test_api_class_patching(mock_dll):
+    api = dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+
+    # Test that a loaded API keeps its class, so class-level patches apply
+    assert type(api) is dcc.ScannerIntegrationAPI
+    with patch.object(dcc.ScannerIntegrationAPI, "buic_init", return_value=42):
+        assert api.buic_init() == 42
+    mock_dll.BUICInit.assert_not_called()
+
+def test_api_use_last_error():
+    with patch("os.path.isfile", return_value=True):
+        with patch("ctypes.WinDLL") as mock:
+            dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll")
+            dcc.ScannerIntegrationAPI(dll_path="fake/path/buicap32.dll", use_last_error=True)
+
+    # Test that the flag is passed through to ctypes.WinDLL
+    assert [call.kwargs["use_last_error"] for call in mock.call_args_list] == [False, True]